@@ -0,0 +1,257 @@
+"""
+API endpoint discovery for Adobe Helper
+
+This module resolves the API endpoint URLs from discovery JSON files and
+environment variable overrides. It is imported lazily from
+:func:`adobe.urls.get_api_endpoints` so that callers who only read the URL
+constants never pay for the discovery machinery at import time.
+"""
+
+import functools
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+from adobe.constants import default_session_path
+from adobe.urls import API_CONVERT, API_DOWNLOAD, API_STATUS, API_UPLOAD
+
+logger = logging.getLogger(__name__)
+
+_ENDPOINT_ENV_VARS = {
+    "upload": "ADOBE_HELPER_UPLOAD_URL",
+    "conversion": "ADOBE_HELPER_CONVERSION_URL",
+    "status": "ADOBE_HELPER_STATUS_URL",
+    "download": "ADOBE_HELPER_DOWNLOAD_URL",
+}
+
+_CONFIG_ENV_VAR = "ADOBE_HELPER_ENDPOINTS_FILE"
+_DISCOVERY_FILENAME = "discovered_endpoints.json"
+_DISCOVERY_KEYS = ("upload", "conversion", "status", "download")
+_DISCOVERY_INSTRUCTIONS = (
+    "1. Open: https://www.adobe.com/acrobat/online/pdf-to-word.html",
+    "2. Press F12 (Chrome DevTools)",
+    "3. Go to Network tab",
+    "4. Check 'Preserve log'",
+    "5. Filter: Only 'Fetch/XHR'",
+    "6. Upload a small PDF",
+    "7. Document the 3 endpoints below",
+    "8. Run: python -m adobe.cli.api_discovery_helper update",
+)
+
+# Real working defaults; shared by every get_api_endpoints() call
+_DEFAULT_ENDPOINTS = {
+    "upload": API_UPLOAD,
+    "conversion": API_CONVERT,
+    "status": API_STATUS,
+    "download": API_DOWNLOAD,
+}
+
+
+def _extract_endpoint_url(entry) -> str | None:
+    """Extract a URL string from a discovery entry."""
+
+    if isinstance(entry, str) and entry.strip():
+        return entry.strip()
+
+    if isinstance(entry, dict):
+        url = entry.get("url")
+        if isinstance(url, str) and url.strip():
+            return url.strip()
+
+    return None
+
+
+def _load_endpoints_from_file(config_path: Path) -> dict[str, str]:
+    """Load endpoint URLs from the discovery JSON file."""
+
+    try:
+        # Read then parse: the C decoder works on a single str, avoiding
+        # json.load's incremental reads for these tiny files
+        with config_path.open("r", encoding="utf-8") as file:
+            content = json.loads(file.read())
+    except FileNotFoundError:
+        logger.debug("Endpoint discovery file not found: %s", config_path)
+        return {}
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Failed to read endpoint discovery file %s: %s", config_path, exc)
+        return {}
+
+    data = content.get("endpoints") if isinstance(content, dict) else None
+    if not isinstance(data, dict):
+        logger.warning(
+            "Endpoint discovery file %s does not contain an 'endpoints' mapping",
+            config_path,
+        )
+        return {}
+
+    extracted: dict[str, str] = {}
+
+    for key in ("upload", "conversion", "status", "download"):
+        value = _extract_endpoint_url(data.get(key))
+        if value:
+            extracted[key] = value
+
+    if extracted:
+        logger.info("Loaded API endpoints from %s", config_path)
+
+    return extracted
+
+
+# Candidate lists keyed by (explicit path, config env var, cwd); Path.home()
+# is left out of the key because it does not change mid-process
+_candidate_cache: dict[tuple[str, str, str], list[Path]] = {}
+
+
+def _candidate_endpoint_files(explicit_path: str | Path | None = None) -> list[Path]:
+    """Return candidate paths for the discovery JSON file."""
+
+    cache_key = (
+        os.fspath(explicit_path) if explicit_path else "",
+        os.environ.get(_CONFIG_ENV_VAR, ""),
+        os.getcwd(),
+    )
+    cached = _candidate_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    candidates: list[Path] = []
+
+    if explicit_path:
+        candidates.append(Path(explicit_path).expanduser())
+
+    if _CONFIG_ENV_VAR in os.environ:
+        env_path = os.environ[_CONFIG_ENV_VAR]
+        if env_path:
+            candidates.append(Path(env_path).expanduser())
+
+    candidates.append(Path.cwd() / _DISCOVERY_FILENAME)
+    package_root = Path(__file__).resolve().parent.parent
+    candidates.append(package_root / _DISCOVERY_FILENAME)
+    candidates.append(package_root / "docs" / "discovery" / _DISCOVERY_FILENAME)
+    candidates.append(package_root / "archive" / "discovery" / _DISCOVERY_FILENAME)
+    home_config = default_session_path() / _DISCOVERY_FILENAME
+    candidates.append(home_config)
+
+    # Dedup on the string form; resolve() would stat-walk the filesystem for
+    # candidates that mostly do not exist.
+    unique_candidates: list[Path] = []
+    seen: set[str] = set()
+    for candidate in candidates:
+        key = os.fspath(candidate)
+        if key not in seen:
+            seen.add(key)
+            unique_candidates.append(candidate)
+
+    _candidate_cache[cache_key] = unique_candidates
+    return unique_candidates
+
+
+def _load_configured_endpoints(
+    config_path: str | Path | None = None,
+) -> tuple[dict[str, str], Path | None]:
+    for candidate in _candidate_endpoint_files(config_path):
+        # os.path.isfile goes straight to stat() without Path's wrapping
+        if os.path.isfile(candidate):
+            loaded = _load_endpoints_from_file(candidate)
+            if loaded:
+                return loaded, candidate
+    return {}, None
+
+
+def _write_discovery_file(path: Path, endpoints: dict[str, str], status: str) -> None:
+    payload = {
+        "discovery_date": datetime.now().isoformat(),
+        "status": status,
+        "endpoints": {key: {"url": endpoints.get(key, "")} for key in _DISCOVERY_KEYS},
+        "instructions": list(_DISCOVERY_INSTRUCTIONS),
+    }
+
+    try:
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        logger.info("Generated API discovery data at %s", path)
+    except OSError as exc:
+        logger.warning("Failed to write discovery file %s: %s", path, exc)
+
+
+def _ensure_home_discovery_file(endpoints: dict[str, str], source: Path | None = None) -> None:
+    session_dir = default_session_path()
+    try:
+        session_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        logger.warning("Failed to create session directory %s: %s", session_dir, exc)
+        return
+
+    target = session_dir / _DISCOVERY_FILENAME
+
+    if target.exists():
+        return
+
+    if source and source.is_file():
+        try:
+            target.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+            logger.info("Cached API discovery file to %s", target)
+            return
+        except OSError as exc:
+            logger.warning("Failed to cache discovery file to %s: %s", target, exc)
+
+    # Write the endpoints (could be defaults or custom values)
+    has_values = any(endpoints.get(key) for key in _DISCOVERY_KEYS)
+    status_value = "defaults" if has_values else "template"
+    _write_discovery_file(target, endpoints if has_values else {}, status_value)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_api_endpoints_cached(config_path: str | None) -> dict[str, str]:
+    """Resolve endpoints once per config path; cached for the process lifetime."""
+
+    env = os.environ
+
+    # Highest precedence first: environment overrides. Membership tests are
+    # plain dict lookups, so the unconfigured case costs four of them.
+    overrides: dict[str, str] = {}
+    for key, env_var in _ENDPOINT_ENV_VARS.items():
+        if env_var in env:
+            value = env[env_var].strip()
+            if value:
+                overrides[key] = value
+
+    if overrides:
+        logger.info("Loaded API endpoint overrides from environment variables")
+
+    # Probe the discovery file only when the environment left gaps
+    configured: dict[str, str] = {}
+    source: Path | None = None
+    if len(overrides) < len(_DISCOVERY_KEYS):
+        configured, source = _load_configured_endpoints(config_path)
+
+    # Merge in precedence order: env > discovery file > defaults
+    endpoints = dict(_DEFAULT_ENDPOINTS)
+    endpoints.update(configured)
+    endpoints.update(overrides)
+    if overrides:
+        source = None
+
+    # Always ensure home discovery file exists (either cached or as template with defaults)
+    if configured or overrides:
+        # Cache discovered/overridden endpoints
+        cached_values: dict[str, str] = {}
+        for key in _DISCOVERY_KEYS:
+            value = endpoints.get(key, "")
+            if value:
+                cached_values[key] = value
+        if cached_values:
+            _ensure_home_discovery_file(cached_values, source)
+    else:
+        # Create template with working defaults if nothing configured
+        _ensure_home_discovery_file(endpoints, None)
+
+    return endpoints
+
+
+def load(config_path: str | Path | None = None) -> dict[str, str]:
+    """Resolve the merged endpoint dict for ``adobe.urls.get_api_endpoints``."""
+
+    key = os.fspath(config_path) if config_path is not None else None
+    return dict(_get_api_endpoints_cached(key))
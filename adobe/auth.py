@@ -15,10 +15,10 @@ from typing import Any, cast
 import httpx
 
 from adobe.constants import (
-    DEFAULT_SESSION_DIR,
     SESSION_EXPIRY_HOURS,
     SESSION_FILE,
     SESSION_INIT_TIMEOUT,
+    default_session_path,
 )
 from adobe.exceptions import AuthenticationError
 from adobe.models import SessionInfo
@@ -61,7 +61,7 @@ class SessionManager:
             auto_save: Automatically save session data to disk
         """
         self.client = client
-        self.session_dir = Path.home() / DEFAULT_SESSION_DIR if session_dir is None else session_dir
+        self.session_dir = default_session_path() if session_dir is None else session_dir
         self.auto_save = auto_save
 
         # Ensure session directory exists
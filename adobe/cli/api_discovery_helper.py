@@ -23,7 +23,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
 
-from adobe.constants import DEFAULT_SESSION_DIR
+from adobe.constants import DEFAULT_SESSION_DIR, default_session_path
 
 PROJECT_DISCOVERY_FILE = Path("docs/discovery/discovered_endpoints.json")
 
@@ -32,7 +32,7 @@ def _candidate_cache_dirs() -> tuple[Path, ...]:
     """Return candidate directories for storing discovery cache files."""
 
     return (
-        Path.home() / DEFAULT_SESSION_DIR,
+        default_session_path(),
         Path.cwd() / DEFAULT_SESSION_DIR,
         Path(tempfile.gettempdir()) / DEFAULT_SESSION_DIR,
     )
@@ -35,6 +35,7 @@ from adobe.upload import FileUploader
 from adobe.urls import (
     COMMON_HEADERS,
     DEFAULT_USER_AGENT,
+    fresh_headers,
     get_api_endpoints,
     get_endpoints_for_session,
 )
@@ -409,7 +410,7 @@ class AdobePDFConverter:
             raise
 
     async def _refresh_access_token(self) -> dict[str, str]:
-        headers = {**COMMON_HEADERS}
+        headers = fresh_headers()
 
         access_token: str | None = None
 
@@ -461,6 +462,9 @@ class AdobePDFConverter:
 
     async def close(self) -> None:
         """Close the converter and clean up resources"""
+        if self.usage_tracker:
+            self.usage_tracker.flush()
+
         if self.client:
             await self.client.aclose()
 
@@ -5,6 +5,9 @@ This module contains configuration constants, limits, and default values
 used throughout the library.
 """
 
+import functools
+from pathlib import Path
+
 from adobe.models import ConversionType
 
 # File constraints
@@ -51,14 +54,28 @@ COOKIE_MAX_AGE_DAYS = 7  # Clean up cookies older than 7 days
 # Free tier quotas
 FREE_TIER_DAILY_LIMIT = 2  # Adobe's free tier allows ~2 conversions per day
 FREE_TIER_SESSION_LIMIT = 2  # Per anonymous session
+MAX_CONVERSION_HISTORY = 100  # Per-day conversion records retained on disk
 
 # Storage paths
 DEFAULT_SESSION_DIR = ".adobe-helper"
 SESSION_FILE = "session.json"
 COOKIES_DIR = "cookies"
-USAGE_FILE = "usage.json"
+USAGE_FILE = "usage.json"  # Legacy monolithic format, migrated on first load
+USAGE_META_FILE = "usage_meta.json"
+USAGE_HISTORY_FILE = "usage_history.jsonl"
 CACHE_DIR = "cache"
 
+
+@functools.lru_cache(maxsize=1)
+def default_session_path() -> Path:
+    """Session data directory (~/.adobe-helper), resolved once per process
+
+    Path.home() re-reads the HOME environment variable on every call, so
+    the result is memoized; the home directory does not change mid-process.
+    """
+    return Path.home() / DEFAULT_SESSION_DIR
+
+
 # HTTP settings
 HTTP_MAX_REDIRECTS = 10
 HTTP_MAX_CONNECTIONS = 100
@@ -10,7 +10,7 @@ import logging
 import time
 from pathlib import Path
 
-from adobe.constants import COOKIE_MAX_AGE_DAYS, COOKIES_DIR, DEFAULT_SESSION_DIR
+from adobe.constants import COOKIE_MAX_AGE_DAYS, COOKIES_DIR, default_session_path
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +30,7 @@ class CookieManager:
         Args:
             cookie_dir: Directory to store cookie files (default: ~/.adobe-helper/cookies)
         """
-        base_dir = Path.home() / DEFAULT_SESSION_DIR if cookie_dir is None else cookie_dir
+        base_dir = default_session_path() if cookie_dir is None else cookie_dir
         self.cookie_dir = base_dir / COOKIES_DIR if cookie_dir is None else cookie_dir
 
         # Ensure cookie directory exists
@@ -6,13 +6,16 @@ Note: Many of these URLs are placeholders and will be updated after
 network analysis during actual PDF upload on Adobe's website.
 """
 
-import json
+from __future__ import annotations
+
 import logging
-import os
-from datetime import datetime
-from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+from urllib.parse import quote
 
-from adobe.constants import DEFAULT_SESSION_DIR
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
 
 # Base URLs
 ADOBE_BASE_URL = "https://www.adobe.com"
@@ -67,236 +70,77 @@ IMS_GUEST_SCOPE = (
     "agreement_read,agreement_write,widget_read,widget_write,workflow_read,workflow_write,"
     "sign_library_read,sign_user_login,sao.ACOM_ESIGN_TRIAL,ee.dcweb"
 )
+# URL-encoded form of the scope, precomputed once at import for callers that
+# splice it into URLs rather than form bodies
+IMS_GUEST_SCOPE_ENCODED = quote(IMS_GUEST_SCOPE, safe=",")
 IMS_JSL_VERSION = "v1-v0.49.0-1-g118f48c"
 IMS_REFERER = PDF_TO_WORD_PAGE
 IMS_ORIGIN = "https://www.adobe.com"
 
 # Headers
-DEFAULT_USER_AGENT = (
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/120.0.0.0 Safari/537.36"
-)
+# Shared Chrome fingerprint tail; one interned copy instead of three
+_WEBKIT_TAIL = "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
-# Alternative user agents for session rotation
-USER_AGENTS = [
+DEFAULT_USER_AGENT = f"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) {_WEBKIT_TAIL}"
+
+# Alternative user agents for session rotation (read-only, hence a tuple)
+USER_AGENTS = (
     # macOS Chrome
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/120.0.0.0 Safari/537.36",
+    DEFAULT_USER_AGENT,
     # Windows Chrome
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/120.0.0.0 Safari/537.36",
+    f"Mozilla/5.0 (Windows NT 10.0; Win64; x64) {_WEBKIT_TAIL}",
     # Linux Chrome
-    "Mozilla/5.0 (X11; Linux x86_64) "
-    "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/120.0.0.0 Safari/537.36",
-]
-
-# Common headers
-COMMON_HEADERS = {
-    "Accept": "application/json, text/plain, */*",
-    "Accept-Language": "en-US,en;q=0.9",
-    "Accept-Encoding": "gzip, deflate, br",
-    "DNT": "1",
-}
+    f"Mozilla/5.0 (X11; Linux x86_64) {_WEBKIT_TAIL}",
+)
+
+# Common headers. Shared read-only templates: httpx accepts any Mapping, so
+# these can be passed directly without a defensive per-request copy; use
+# fresh_headers() when a mutable copy is genuinely needed.
+COMMON_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+    }
+)
+
+# Frozen item view for request builders that need a fresh mutable dict:
+# dict(COMMON_HEADERS_ITEMS) skips re-reading the source dict each time
+COMMON_HEADERS_ITEMS = tuple(COMMON_HEADERS.items())
 
 # Headers required when performing the initial navigation request to the
 # public PDF-to-Word page. Adobe's edge infrastructure expects a modern
 # browser fingerprint when the Chrome user agent is advertised; without
 # these Client Hints the server responds with an HTTP/2 protocol error.
-SESSION_INIT_HEADERS = {
-    "Accept": (
-        "text/html,application/xhtml+xml,application/xml;q=0.9,"
-        "image/avif,image/webp,image/apng,*/*;q=0.8,"
-        "application/signed-exchange;v=b3;q=0.7"
-    ),
-    "Accept-Language": "en-US,en;q=0.9",
-    "Accept-Encoding": "gzip, deflate, br",
-    "DNT": "1",
-    "Sec-Fetch-Dest": "document",
-    "Sec-Fetch-Mode": "navigate",
-    "Sec-Fetch-Site": "none",
-    "Sec-Fetch-User": "?1",
-    "Upgrade-Insecure-Requests": "1",
-    "sec-ch-ua": '"Chromium";v="120", "Not=A?Brand";v="8", "Google Chrome";v="120"',
-    "sec-ch-ua-mobile": "?0",
-    "sec-ch-ua-platform": '"macOS"',
-}
-
-
-logger = logging.getLogger(__name__)
-
-_ENDPOINT_ENV_VARS = {
-    "upload": "ADOBE_HELPER_UPLOAD_URL",
-    "conversion": "ADOBE_HELPER_CONVERSION_URL",
-    "status": "ADOBE_HELPER_STATUS_URL",
-    "download": "ADOBE_HELPER_DOWNLOAD_URL",
-}
-
-_CONFIG_ENV_VAR = "ADOBE_HELPER_ENDPOINTS_FILE"
-_DISCOVERY_FILENAME = "discovered_endpoints.json"
-_DISCOVERY_KEYS = ("upload", "conversion", "status", "download")
-_DISCOVERY_INSTRUCTIONS = (
-    "1. Open: https://www.adobe.com/acrobat/online/pdf-to-word.html",
-    "2. Press F12 (Chrome DevTools)",
-    "3. Go to Network tab",
-    "4. Check 'Preserve log'",
-    "5. Filter: Only 'Fetch/XHR'",
-    "6. Upload a small PDF",
-    "7. Document the 3 endpoints below",
-    "8. Run: python -m adobe.cli.api_discovery_helper update",
-)
-
-
-def _extract_endpoint_url(entry) -> str | None:
-    """Extract a URL string from a discovery entry."""
-
-    if isinstance(entry, str) and entry.strip():
-        return entry.strip()
-
-    if isinstance(entry, dict):
-        url = entry.get("url")
-        if isinstance(url, str) and url.strip():
-            return url.strip()
-
-    return None
-
-
-def _load_endpoints_from_file(config_path: Path) -> dict[str, str]:
-    """Load endpoint URLs from the discovery JSON file."""
-
-    try:
-        with config_path.open("r", encoding="utf-8") as file:
-            content = json.load(file)
-    except FileNotFoundError:
-        logger.debug("Endpoint discovery file not found: %s", config_path)
-        return {}
-    except (OSError, json.JSONDecodeError) as exc:
-        logger.warning("Failed to read endpoint discovery file %s: %s", config_path, exc)
-        return {}
-
-    data = content.get("endpoints") if isinstance(content, dict) else None
-    if not isinstance(data, dict):
-        logger.warning(
-            "Endpoint discovery file %s does not contain an 'endpoints' mapping",
-            config_path,
-        )
-        return {}
-
-    extracted: dict[str, str] = {}
-
-    for key in ("upload", "conversion", "status", "download"):
-        value = _extract_endpoint_url(data.get(key))
-        if value:
-            extracted[key] = value
-
-    if extracted:
-        logger.info("Loaded API endpoints from %s", config_path)
-
-    return extracted
-
-
-def _candidate_endpoint_files(explicit_path: str | Path | None = None) -> list[Path]:
-    """Return candidate paths for the discovery JSON file."""
-
-    candidates: list[Path] = []
-
-    if explicit_path:
-        candidates.append(Path(explicit_path).expanduser())
-
-    env_path = os.environ.get(_CONFIG_ENV_VAR)
-    if env_path:
-        candidates.append(Path(env_path).expanduser())
-
-    candidates.append(Path.cwd() / _DISCOVERY_FILENAME)
-    package_root = Path(__file__).resolve().parent.parent
-    candidates.append(package_root / _DISCOVERY_FILENAME)
-    candidates.append(package_root / "docs" / "discovery" / _DISCOVERY_FILENAME)
-    candidates.append(package_root / "archive" / "discovery" / _DISCOVERY_FILENAME)
-    home_config = Path.home() / DEFAULT_SESSION_DIR / _DISCOVERY_FILENAME
-    candidates.append(home_config)
-
-    unique_candidates: list[Path] = []
-    seen: set[Path | str] = set()
-    for candidate in candidates:
-        try:
-            resolved = candidate.resolve()
-        except OSError:
-            resolved = candidate
-        if resolved not in seen:
-            seen.add(resolved)
-            unique_candidates.append(candidate)
-
-    return unique_candidates
-
-
-def _load_configured_endpoints(
-    config_path: str | Path | None = None,
-) -> tuple[dict[str, str], Path | None]:
-    for candidate in _candidate_endpoint_files(config_path):
-        if candidate.is_file():
-            loaded = _load_endpoints_from_file(candidate)
-            if loaded:
-                return loaded, candidate
-    return {}, None
-
-
-def _load_env_overrides() -> dict[str, str]:
-    overrides: dict[str, str] = {}
-
-    for key, env_var in _ENDPOINT_ENV_VARS.items():
-        value = os.environ.get(env_var)
-        if isinstance(value, str) and value.strip():
-            overrides[key] = value.strip()
-
-    if overrides:
-        logger.info("Loaded API endpoint overrides from environment variables")
-
-    return overrides
-
-
-def _write_discovery_file(path: Path, endpoints: dict[str, str], status: str) -> None:
-    payload = {
-        "discovery_date": datetime.now().isoformat(),
-        "status": status,
-        "endpoints": {key: {"url": endpoints.get(key, "")} for key in _DISCOVERY_KEYS},
-        "instructions": list(_DISCOVERY_INSTRUCTIONS),
+SESSION_INIT_HEADERS = MappingProxyType(
+    {
+        "Accept": (
+            "text/html,application/xhtml+xml,application/xml;q=0.9,"
+            "image/avif,image/webp,image/apng,*/*;q=0.8,"
+            "application/signed-exchange;v=b3;q=0.7"
+        ),
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Upgrade-Insecure-Requests": "1",
+        "sec-ch-ua": '"Chromium";v="120", "Not=A?Brand";v="8", "Google Chrome";v="120"',
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
     }
+)
 
-    try:
-        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        logger.info("Generated API discovery data at %s", path)
-    except OSError as exc:
-        logger.warning("Failed to write discovery file %s: %s", path, exc)
-
-
-def _ensure_home_discovery_file(endpoints: dict[str, str], source: Path | None = None) -> None:
-    session_dir = Path.home() / DEFAULT_SESSION_DIR
-    try:
-        session_dir.mkdir(parents=True, exist_ok=True)
-    except OSError as exc:
-        logger.warning("Failed to create session directory %s: %s", session_dir, exc)
-        return
-
-    target = session_dir / _DISCOVERY_FILENAME
 
-    if target.exists():
-        return
+def fresh_headers(base: Mapping[str, str] = COMMON_HEADERS) -> dict[str, str]:
+    """Return a mutable copy of a shared header template"""
+    return dict(base)
 
-    if source and source.is_file():
-        try:
-            target.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
-            logger.info("Cached API discovery file to %s", target)
-            return
-        except OSError as exc:
-            logger.warning("Failed to cache discovery file to %s: %s", target, exc)
 
-    # Write the endpoints (could be defaults or custom values)
-    has_values = any(endpoints.get(key) for key in _DISCOVERY_KEYS)
-    status_value = "defaults" if has_values else "template"
-    _write_discovery_file(target, endpoints if has_values else {}, status_value)
+logger = logging.getLogger(__name__)
 
 
 def get_api_endpoints(config_path: str | Path | None = None) -> dict[str, str]:
@@ -308,43 +152,27 @@ def get_api_endpoints(config_path: str | Path | None = None) -> dict[str, str]:
     1. Config files (discovered_endpoints.json)
     2. Environment variables (ADOBE_HELPER_*_URL)
 
+    Discovery lives in :mod:`adobe._endpoint_discovery` and is imported on
+    first use so that modules which only read URL constants skip it. The
+    merged result is memoized per config path; call
+    ``get_api_endpoints.cache_clear()`` to force a re-scan.
+
     Returns:
         Dictionary with endpoint URLs for upload, conversion, status, download
     """
-    # Start with real working defaults
-    endpoints = {
-        "upload": API_UPLOAD,
-        "conversion": API_CONVERT,
-        "status": API_STATUS,
-        "download": API_DOWNLOAD,
-    }
+    from adobe._endpoint_discovery import load
 
-    # Override with discovered endpoints if available
-    configured, source = _load_configured_endpoints(config_path)
-    if configured:
-        endpoints.update(configured)
-
-    # Override with environment variables (highest priority)
-    overrides = _load_env_overrides()
-    if overrides:
-        endpoints.update(overrides)
-        source = None
-
-    # Always ensure home discovery file exists (either cached or as template with defaults)
-    if configured or overrides:
-        # Cache discovered/overridden endpoints
-        cached_values: dict[str, str] = {}
-        for key in _DISCOVERY_KEYS:
-            value = endpoints.get(key, "")
-            if value:
-                cached_values[key] = value
-        if cached_values:
-            _ensure_home_discovery_file(cached_values, source)
-    else:
-        # Create template with working defaults if nothing configured
-        _ensure_home_discovery_file(endpoints, None)
+    return load(config_path)
 
-    return endpoints
+
+def _clear_endpoint_cache() -> None:
+    from adobe import _endpoint_discovery
+
+    _endpoint_discovery._get_api_endpoints_cached.cache_clear()
+    _endpoint_discovery._candidate_cache.clear()
+
+
+get_api_endpoints.cache_clear = _clear_endpoint_cache  # type: ignore[attr-defined]
 
 
 def build_endpoint_urls(
@@ -3,18 +3,89 @@ Usage tracking for Adobe Helper free tier
 
 This module tracks conversion usage to respect Adobe's free tier limits
 and avoid exceeding daily conversion quotas.
+
+Storage is split into a small metadata file (date and count, rewritten on
+save) and an append-only JSONL history file, so per-conversion work stays
+O(1) instead of re-serializing the full history each time.
 """
 
+import atexit
 import json
 import logging
+import os
+import time
+import weakref
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any, cast
 
-from adobe.constants import DEFAULT_SESSION_DIR, FREE_TIER_DAILY_LIMIT, USAGE_FILE
+from adobe.constants import (
+    FREE_TIER_DAILY_LIMIT,
+    MAX_CONVERSION_HISTORY,
+    USAGE_FILE,
+    USAGE_HISTORY_FILE,
+    USAGE_META_FILE,
+    default_session_path,
+)
+
+try:
+    # Optional fast path: orjson parses and serializes several times faster
+    # than the stdlib json module
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dump_line(obj: Any) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dump_line(obj: Any) -> bytes:
+        return json.dumps(obj).encode() + b"\n"
+
 
 logger = logging.getLogger(__name__)
 
+_today_cache: tuple[float, str] = (0.0, "")
+
+
+def _today() -> str:
+    """Return today's date string, cached at 60-second granularity"""
+    global _today_cache
+
+    now = time.monotonic()
+    cached_at, value = _today_cache
+    if value and now - cached_at < 60.0:
+        return value
+
+    value = str(date.today())
+    _today_cache = (now, value)
+    return value
+
+
+# Trackers with potentially unflushed increments; weak references so the
+# exit hook never keeps discarded trackers alive
+_live_trackers: weakref.WeakSet["FreeUsageTracker"] = weakref.WeakSet()
+
+
+def _flush_live_trackers() -> None:
+    """Flush batched updates from trackers still alive at interpreter exit"""
+    for tracker in list(_live_trackers):
+        tracker.flush()
+
+
+atexit.register(_flush_live_trackers)
+
 
 class FreeUsageTracker:
     """
@@ -32,72 +103,199 @@ class FreeUsageTracker:
             usage_dir: Directory to store usage data (default: ~/.adobe-helper)
             daily_limit: Maximum free conversions per day
         """
-        self.usage_dir = Path.home() / DEFAULT_SESSION_DIR if usage_dir is None else usage_dir
+        self.usage_dir = default_session_path() if usage_dir is None else usage_dir
         self.daily_limit = daily_limit
-        self.usage_file = self.usage_dir / USAGE_FILE
+        self.usage_file = self.usage_dir / USAGE_FILE  # Legacy monolithic file
+        self.meta_file = self.usage_dir / USAGE_META_FILE
+        self.history_file = self.usage_dir / USAGE_HISTORY_FILE
+
+        # Ensure directory exists; the isdir guard keeps repeated tracker
+        # construction to a single stat() in the common case
+        if not os.path.isdir(self.usage_dir):
+            self.usage_dir.mkdir(parents=True, exist_ok=True)
+
+        # Load or initialize usage data; _maybe_refresh keeps the in-memory
+        # copy authoritative until the file or the date changes
+        self.usage_data: dict[str, Any] = {}
+        self._mtime_cached = 0.0
+        self._dirty = False
+        self._pending_records: list[dict[str, Any]] = []
+        self._maybe_refresh()
+
+        # Flush any batched increments if the process exits without close()
+        _live_trackers.add(self)
+
+    def _maybe_refresh(self) -> None:
+        """
+        Re-read usage data only when it may actually have changed
 
-        # Ensure directory exists
-        self.usage_dir.mkdir(parents=True, exist_ok=True)
+        The file is reloaded when its mtime differs from the cached value
+        (another process wrote it) or the recorded date is stale (day
+        rollover). Otherwise the in-memory copy is trusted, turning a JSON
+        parse per query into a single stat() call.
+        """
+        if self._dirty:
+            # Unsaved in-memory increments are newer than anything on disk
+            return
+
+        try:
+            mtime = os.stat(self.meta_file).st_mtime
+        except OSError:
+            mtime = 0.0
 
-        # Load or initialize usage data
-        self.usage_data: dict[str, Any] = self._load_usage()
+        if mtime == self._mtime_cached and self.usage_data.get("date") == _today():
+            return
+
+        self.usage_data = self._load_usage()
+        self._mtime_cached = mtime
 
     def _load_usage(self) -> dict[str, Any]:
         """
-        Load usage data from disk
+        Load usage metadata from disk
+
+        Falls back to migrating the legacy monolithic usage.json when no
+        metadata file exists yet.
 
         Returns:
-            Dictionary with usage data
+            Dictionary with usage metadata (date and count)
         """
-        if not self.usage_file.exists():
+        if not os.path.exists(self.meta_file):
+            migrated = self._migrate_legacy_usage()
+            if migrated is not None:
+                return migrated
             return self._create_empty_usage()
 
         try:
-            with open(self.usage_file) as f:
-                raw_data = json.load(f)
+            raw_data = _loads(self.meta_file.read_bytes())
 
             if not isinstance(raw_data, dict):
                 logger.error("Usage data malformed; resetting usage file")
-                return self._create_empty_usage()
+                return self._reset_for_new_day()
 
             data = cast(dict[str, Any], raw_data)
 
             # Check if date has changed (new day)
-            today = str(date.today())
-            if data.get("date") != today:
+            if data.get("date") != _today():
                 logger.info("New day detected - resetting usage counter")
-                return self._create_empty_usage()
+                return self._reset_for_new_day()
 
             return data
 
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, ValueError) as e:
             logger.error(f"Failed to load usage data: {e}")
-            return self._create_empty_usage()
+            return self._reset_for_new_day()
+
+    def _migrate_legacy_usage(self) -> dict[str, Any] | None:
+        """
+        Split a pre-existing monolithic usage.json into meta + history files
+
+        Returns:
+            Migrated metadata dict, or None when there is nothing usable
+        """
+        try:
+            raw_data = _loads(self.usage_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(raw_data, dict) or raw_data.get("date") != _today():
+            self._remove_legacy_file()
+            return None
+
+        conversions = raw_data.get("conversions")
+        if isinstance(conversions, list):
+            records = [item for item in conversions if isinstance(item, dict)]
+            if records:
+                try:
+                    with open(self.history_file, "ab") as f:
+                        f.write(b"".join(_dump_line(record) for record in records))
+                except OSError as e:
+                    logger.error(f"Failed to migrate usage history: {e}")
+
+        meta = {
+            "date": raw_data.get("date"),
+            "count": int(raw_data.get("count", 0)),
+        }
+
+        # Persist the migrated metadata before deleting the legacy file so a
+        # crash in between cannot erase the day's count
+        self.usage_data = meta
+        self._save_usage()
+        self._remove_legacy_file()
+        logger.info("Migrated legacy usage file to meta + history format")
+        return meta
+
+    def _remove_legacy_file(self) -> None:
+        try:
+            os.remove(self.usage_file)
+        except OSError:
+            pass
+
+    def _reset_for_new_day(self) -> dict[str, Any]:
+        """Clear stale history and return fresh usage metadata"""
+        self._pending_records.clear()
+        try:
+            os.remove(self.history_file)
+        except OSError:
+            pass
+        return self._create_empty_usage()
 
     def _create_empty_usage(self) -> dict[str, Any]:
         """
-        Create empty usage data structure for current day
+        Create empty usage metadata for current day
 
         Returns:
-            Dictionary with initial usage data
+            Dictionary with initial usage metadata
         """
         return {
-            "date": str(date.today()),
+            "date": _today(),
             "count": 0,
-            "conversions": [],
         }
 
     def _save_usage(self) -> None:
         """Save usage data to disk"""
         try:
-            with open(self.usage_file, "w") as f:
-                json.dump(self.usage_data, f, indent=2)
-
+            if self._pending_records:
+                # History is append-only: O(1) per record instead of
+                # re-serializing the full day's list
+                with open(self.history_file, "ab") as f:
+                    f.write(b"".join(_dump_line(record) for record in self._pending_records))
+                self._pending_records.clear()
+
+                if int(self.usage_data.get("count", 0)) > MAX_CONVERSION_HISTORY:
+                    self._trim_history()
+
+            # Write-then-rename so a mid-write crash can never leave a
+            # truncated file that would reset the day's counter on reload
+            tmp_file = self.meta_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(_dumps(self.usage_data))
+            os.replace(tmp_file, self.meta_file)
+
+            self._mtime_cached = os.stat(self.meta_file).st_mtime
+            self._dirty = False
             logger.debug(f"Usage data saved: {self.usage_data['count']} conversions")
 
         except OSError as e:
             logger.error(f"Failed to save usage data: {e}")
 
+    def _trim_history(self) -> None:
+        """Drop all but the most recent MAX_CONVERSION_HISTORY records"""
+        try:
+            lines = self.history_file.read_bytes().splitlines(keepends=True)
+        except OSError:
+            return
+
+        if len(lines) <= MAX_CONVERSION_HISTORY:
+            return
+
+        tmp_file = self.history_file.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                f.writelines(lines[-MAX_CONVERSION_HISTORY:])
+            os.replace(tmp_file, self.history_file)
+        except OSError as e:
+            logger.error(f"Failed to trim usage history: {e}")
+
     def can_convert(self) -> bool:
         """
         Check if conversion is allowed under free tier limits
@@ -106,7 +304,7 @@ class FreeUsageTracker:
             True if conversion is allowed, False if limit exceeded
         """
         # Refresh data in case day has changed
-        self.usage_data = self._load_usage()
+        self._maybe_refresh()
 
         current_count = int(self.usage_data.get("count", 0))
         can_proceed = current_count < self.daily_limit
@@ -124,24 +322,29 @@ class FreeUsageTracker:
             filename: Optional filename of the converted file
         """
         # Refresh data
-        self.usage_data = self._load_usage()
+        self._maybe_refresh()
 
         current_count = int(self.usage_data.get("count", 0))
         self.usage_data["count"] = current_count + 1
 
-        # Record conversion details
+        # Record conversion details; second precision keeps the record
+        # human-readable while skipping microsecond formatting work
         conversion_record: dict[str, Any] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
             "filename": filename,
         }
-        self.usage_data["conversions"].append(conversion_record)
+        self._pending_records.append(conversion_record)
 
-        # Save updated data
-        self._save_usage()
+        # Mark dirty instead of rewriting the file per increment; data is
+        # persisted by flush() (converter close / atexit)
+        self._dirty = True
 
         # Log warning if approaching limit
         remaining = self.get_remaining()
         if remaining <= 1:
+            # Persist immediately near the limit so a crash cannot grant
+            # extra free conversions on restart
+            self.flush()
             logger.warning(f"Approaching daily limit: {remaining} conversion(s) remaining")
         else:
             logger.info(f"Conversion tracked: {self.usage_data['count']}/{self.daily_limit}")
@@ -154,7 +357,7 @@ class FreeUsageTracker:
             Number of conversions performed today
         """
         # Refresh data
-        self.usage_data = self._load_usage()
+        self._maybe_refresh()
         return int(self.usage_data.get("count", 0))
 
     def get_remaining(self) -> int:
@@ -166,9 +369,14 @@ class FreeUsageTracker:
         """
         return max(0, self.daily_limit - self.get_current_count())
 
+    def flush(self) -> None:
+        """Write batched usage updates to disk if any are pending"""
+        if self._dirty:
+            self._save_usage()
+
     def reset_usage(self) -> None:
         """Reset usage data (useful for testing or manual reset)"""
-        self.usage_data = self._create_empty_usage()
+        self.usage_data = self._reset_for_new_day()
         self._save_usage()
         logger.info("Usage data reset")
 
@@ -177,14 +385,31 @@ class FreeUsageTracker:
         Get the list of conversions performed today
 
         Returns:
-            List of conversion records with timestamps
+            List of conversion records with timestamps, capped at the most
+            recent MAX_CONVERSION_HISTORY entries
         """
         # Refresh data
-        self.usage_data = self._load_usage()
-        conversions = self.usage_data.get("conversions", [])
-        if not isinstance(conversions, list):
-            return []
-        return [cast(dict[str, Any], item) for item in conversions if isinstance(item, dict)]
+        self._maybe_refresh()
+
+        records: list[dict[str, Any]] = []
+        try:
+            with open(self.history_file, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        item = _loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(item, dict):
+                        records.append(cast(dict[str, Any], item))
+        except OSError:
+            pass
+
+        # Batched records not yet flushed are still part of today's history
+        records.extend(self._pending_records)
+        return records[-MAX_CONVERSION_HISTORY:]
 
     def get_usage_summary(self) -> dict[str, Any]:
         """
@@ -194,14 +419,14 @@ class FreeUsageTracker:
             Dictionary with usage statistics
         """
         # Refresh data
-        self.usage_data = self._load_usage()
+        self._maybe_refresh()
 
         count = int(self.usage_data.get("count", 0))
         remaining = self.get_remaining()
         percentage_used = (count / self.daily_limit * 100) if self.daily_limit > 0 else 0
 
         return {
-            "date": str(self.usage_data.get("date", str(date.today()))),
+            "date": str(self.usage_data.get("date", _today())),
             "count": count,
             "limit": self.daily_limit,
             "remaining": remaining,
@@ -6,6 +6,18 @@ from unittest.mock import AsyncMock, MagicMock
 import httpx
 import pytest
 
+from adobe import constants, urls
+
+
+@pytest.fixture(autouse=True)
+def clear_endpoint_cache():
+    """Reset memoized lookups so tests see fresh discovery and home state"""
+    urls.get_api_endpoints.cache_clear()
+    constants.default_session_path.cache_clear()
+    yield
+    urls.get_api_endpoints.cache_clear()
+    constants.default_session_path.cache_clear()
+
 
 @pytest.fixture
 def sample_pdf_path(tmp_path: Path) -> Path:
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from adobe import urls
+from adobe import _endpoint_discovery, urls
 from adobe.constants import DEFAULT_SESSION_DIR
 
 
@@ -37,7 +37,7 @@ def test_get_api_endpoints_uses_discovery_file(
         "discovery_date": "2024-10-01T00:00:00",
         "status": "captured",
         "endpoints": {key: {"url": value} for key, value in sample_endpoints.items()},
-        "instructions": list(urls._DISCOVERY_INSTRUCTIONS),  # type: ignore[attr-defined]
+        "instructions": list(_endpoint_discovery._DISCOVERY_INSTRUCTIONS),  # type: ignore[attr-defined]
     }
 
     discovery_file = tmp_path / "custom_discovered_endpoints.json"
@@ -48,7 +48,7 @@ def test_get_api_endpoints_uses_discovery_file(
 
     assert endpoints == sample_endpoints
 
-    cached_path = home_dir / DEFAULT_SESSION_DIR / urls._DISCOVERY_FILENAME  # type: ignore[attr-defined]
+    cached_path = home_dir / DEFAULT_SESSION_DIR / _endpoint_discovery._DISCOVERY_FILENAME  # type: ignore[attr-defined]
     assert cached_path.is_file()
     cached_payload = json.loads(cached_path.read_text(encoding="utf-8"))
     assert cached_payload == discovery_payload
@@ -63,7 +63,9 @@ def test_get_api_endpoints_generates_template_when_missing(
     _set_home(monkeypatch, home_dir)
 
     monkeypatch.setattr(
-        urls, "_candidate_endpoint_files", lambda config_path=None: [tmp_path / "missing.json"]
+        _endpoint_discovery,
+        "_candidate_endpoint_files",
+        lambda config_path=None: [tmp_path / "missing.json"],
     )
 
     endpoints = urls.get_api_endpoints()
@@ -73,7 +75,7 @@ def test_get_api_endpoints_generates_template_when_missing(
     assert endpoints["status"] == urls.API_STATUS
     assert endpoints["download"] == urls.API_DOWNLOAD
 
-    template_path = home_dir / DEFAULT_SESSION_DIR / urls._DISCOVERY_FILENAME  # type: ignore[attr-defined]
+    template_path = home_dir / DEFAULT_SESSION_DIR / _endpoint_discovery._DISCOVERY_FILENAME  # type: ignore[attr-defined]
     assert template_path.is_file()
 
     template_payload = json.loads(template_path.read_text(encoding="utf-8"))
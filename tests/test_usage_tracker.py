@@ -0,0 +1,63 @@
+"""Tests for the free-tier usage tracker persistence format."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from adobe.constants import USAGE_FILE, USAGE_HISTORY_FILE, USAGE_META_FILE
+from adobe.usage_tracker import FreeUsageTracker, _today
+
+
+def test_migrates_legacy_usage_file(tmp_path: Path) -> None:
+    """A monolithic usage.json should be split into meta + history files."""
+
+    legacy = {
+        "date": _today(),
+        "count": 2,
+        "conversions": [
+            {"timestamp": "2024-10-01T00:00:00", "filename": "a.pdf"},
+            {"timestamp": "2024-10-01T00:01:00", "filename": "b.pdf"},
+        ],
+    }
+    (tmp_path / USAGE_FILE).write_text(json.dumps(legacy), encoding="utf-8")
+
+    tracker = FreeUsageTracker(usage_dir=tmp_path, daily_limit=10)
+
+    assert tracker.get_current_count() == 2
+    assert [r["filename"] for r in tracker.get_conversion_history()] == ["a.pdf", "b.pdf"]
+
+    # The legacy file is gone and the migrated metadata is already on disk,
+    # so a crash right after migration cannot erase the day's count
+    assert not (tmp_path / USAGE_FILE).exists()
+    meta = json.loads((tmp_path / USAGE_META_FILE).read_text(encoding="utf-8"))
+    assert meta["count"] == 2
+    assert (tmp_path / USAGE_HISTORY_FILE).is_file()
+
+
+def test_increments_are_batched_until_flush(tmp_path: Path) -> None:
+    """Increments stay in memory until flush(), then persist across instances."""
+
+    tracker = FreeUsageTracker(usage_dir=tmp_path, daily_limit=10)
+    tracker.increment_usage("first.pdf")
+
+    # Batched: nothing written yet, but queries see the increment
+    assert not (tmp_path / USAGE_META_FILE).exists()
+    assert tracker.get_current_count() == 1
+    assert [r["filename"] for r in tracker.get_conversion_history()] == ["first.pdf"]
+
+    tracker.flush()
+
+    reloaded = FreeUsageTracker(usage_dir=tmp_path, daily_limit=10)
+    assert reloaded.get_current_count() == 1
+    assert [r["filename"] for r in reloaded.get_conversion_history()] == ["first.pdf"]
+
+
+def test_flushes_immediately_near_daily_limit(tmp_path: Path) -> None:
+    """Approaching the limit must persist right away, not wait for flush()."""
+
+    tracker = FreeUsageTracker(usage_dir=tmp_path, daily_limit=2)
+    tracker.increment_usage("a.pdf")  # remaining == 1
+
+    meta = json.loads((tmp_path / USAGE_META_FILE).read_text(encoding="utf-8"))
+    assert meta["count"] == 1